@@ -3,14 +3,31 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict
 
+import orjson
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse, Response
 
-from service import WebSearchService
+from service import QueryResponse, WebSearchService
 from tools import WebSearchTool
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (UTF-8 output, no ASCII escaping)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def _web_search_payload(response: QueryResponse) -> Dict[str, Any]:
+    return {
+        "overview": response.summary.overview,
+        "highlights": response.summary.highlights,
+        "sources": response.results,
+    }
+
+
 def create_app(service: WebSearchService) -> FastAPI:
-    app = FastAPI(title="MCP Web Search Mock API")
+    app = FastAPI(title="MCP Web Search Mock API", default_response_class=ORJSONResponse)
     tool = WebSearchTool(service)
     logger = logging.getLogger("mock_api")
 
@@ -23,17 +40,17 @@ def create_app(service: WebSearchService) -> FastAPI:
         query: str = Query(..., description="Query string to search for"),
         agent_id: str = Query("mock-http", description="Agent identifier"),
         max_results: int = Query(5, description="Maximum results to fetch"),
-    ) -> Dict[str, Any]:
+    ) -> Response:
         try:
-            result = await tool.execute(agent_id=agent_id, query=query, max_results=max_results)
+            response = await service.query(agent_id=agent_id, query=query, max_results=max_results)
         except Exception as exc:  # broad for mock server, log and wrap
             logger.exception("Mock search failed: %s", exc)
             raise HTTPException(status_code=500, detail=str(exc)) from exc
-        return {
-            "overview": result.overview,
-            "highlights": result.highlights,
-            "sources": result.sources,
-        }
+        # Cached responses keep their encoded body, so repeat queries skip serialisation.
+        return Response(
+            content=response.encoded("web-search", _web_search_payload),
+            media_type="application/json",
+        )
 
     @app.get("/web-search/page")
     async def web_search_page(url: str = Query(..., description="URL to fetch")) -> Dict[str, Any]:
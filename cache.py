@@ -1,35 +1,57 @@
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 
+# Number of ``set`` calls between full sweeps for expired entries.
+_SWEEP_INTERVAL = 256
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CacheEntry:
     value: Any
     expires_at: float
 
 
 class QueryCache:
-    """Simple in-memory cache with TTL in seconds."""
+    """In-memory LRU cache with TTL in seconds and a bounded number of entries."""
 
-    def __init__(self, ttl_seconds: int) -> None:
+    def __init__(self, ttl_seconds: int, max_entries: int = 1024) -> None:
         self._ttl = ttl_seconds
-        self._store: Dict[str, CacheEntry] = {}
+        self._max_entries = max_entries
+        self._store: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._sets_since_sweep = 0
 
     def get(self, key: str) -> Optional[Any]:
         entry = self._store.get(key)
         if not entry:
             return None
-        if entry.expires_at < time.time():
-            self._store.pop(key, None)
+        if entry.expires_at < time.monotonic():
+            del self._store[key]
             return None
+        self._store.move_to_end(key)
         return entry.value
 
     def set(self, key: str, value: Any) -> None:
-        expires_at = time.time() + self._ttl
-        self._store[key] = CacheEntry(value=value, expires_at=expires_at)
+        now = time.monotonic()
+        self._store[key] = CacheEntry(value=value, expires_at=now + self._ttl)
+        self._store.move_to_end(key)
+
+        self._sets_since_sweep += 1
+        if self._sets_since_sweep >= _SWEEP_INTERVAL:
+            self._sweep(now)
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
 
     def clear(self) -> None:
         self._store.clear()
+        self._sets_since_sweep = 0
+
+    def _sweep(self, now: float) -> None:
+        """Drop entries that expired without being read again."""
+        self._sets_since_sweep = 0
+        expired = [key for key, entry in self._store.items() if entry.expires_at < now]
+        for key in expired:
+            del self._store[key]
@@ -22,6 +22,10 @@ class AppConfig(BaseSettings):
     use_stub_data: bool = Field(False, alias="USE_STUB_DATA")
     enable_query_cache: bool = Field(True, alias="ENABLE_QUERY_CACHE")
     cache_ttl_seconds: int = Field(600, alias="CACHE_TTL_SECONDS")
+    cache_max_entries: int = Field(1024, alias="CACHE_MAX_ENTRIES")
+    enable_page_cache: bool = Field(True, alias="ENABLE_PAGE_CACHE")
+    page_cache_ttl_seconds: int = Field(300, alias="PAGE_CACHE_TTL_SECONDS")
+    page_cache_max_entries: int = Field(128, alias="PAGE_CACHE_MAX_ENTRIES")
     search_user_agent: str = Field(
         "Mozilla/5.0 (compatible; MCPWebSearch/0.1; +https://example.com/bot)",
         alias="SEARCH_USER_AGENT",
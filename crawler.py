@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import codecs
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
+# Crawls fan out across many hosts; keep an idle connection per host for a minute so
+# domains that recur across queries skip the TCP/TLS handshake.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=50, max_keepalive_connections=50, keepalive_expiry=60.0
+)
 
-@dataclass
+# Elements whose contents are not page text (BeautifulSoup's get_text skips them too).
+_NON_TEXT_TAGS = ["script", "style", "noscript", "template"]
+
+
+@dataclass(slots=True)
 class FetchedPage:
     """Representation of a fetched web page."""
 
@@ -16,37 +26,72 @@ class FetchedPage:
     content: bytes
     content_type: Optional[str]
     text: Optional[str] = None
-    html: Optional[str] = None
+    encoding: Optional[str] = None
+
+    @property
+    def is_text(self) -> bool:
+        return bool(self.content_type and "text" in self.content_type)
+
+    @property
+    def html(self) -> Optional[str]:
+        """Decoded markup for text responses, built on access so text-only callers skip it."""
+        if not self.content or not self.is_text:
+            return None
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
 
 
 class Crawler:
     """Minimal asynchronous HTTP client for following search results."""
 
     def __init__(self, timeout_seconds: int = 10) -> None:
-        self._client = httpx.AsyncClient(timeout=timeout_seconds, follow_redirects=True)
+        self._client = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=_POOL_LIMITS, retries=2),
+        )
+
+    async def fetch(
+        self,
+        url: str,
+        *,
+        max_text_chars: Optional[int] = None,
+        keep_html: bool = True,
+    ) -> FetchedPage:
+        """Fetch url and extract its text.
 
-    async def fetch(self, url: str) -> FetchedPage:
+        ``max_text_chars`` truncates the extracted text before it is stored on the page;
+        ``keep_html=False`` drops the raw body once text has been extracted.
+        """
         response = await self._client.get(url)
         content_type = response.headers.get("content-type")
+        content = response.content
+        encoding = response.encoding or "utf-8"
         text: Optional[str] = None
-        html: Optional[str] = None
         try:
             if content_type and "text" in content_type:
-                html = response.text
-                soup = BeautifulSoup(html, "html.parser")
-                text = soup.get_text(" ", strip=True)
+                tree = LexborHTMLParser(_parser_input(content, encoding))
+                tree.strip_tags(_NON_TEXT_TAGS)
+                text = " ".join(tree.body.text(separator=" ").split()) if tree.body else ""
         except Exception:
-            html = response.text
-            text = html[:10000]
+            text = content.decode(encoding, errors="replace")[:10000]
+        if text is not None and max_text_chars is not None:
+            text = text[:max_text_chars]
 
         return FetchedPage(
             url=str(response.url),
             status_code=response.status_code,
-            content=response.content,
+            content=content if keep_html else b"",
             content_type=content_type,
             text=text,
-            html=html,
+            encoding=encoding,
         )
 
     async def close(self) -> None:
         await self._client.aclose()
+
+
+def _parser_input(content: bytes, encoding: str) -> Union[bytes, str]:
+    """Hand UTF-8 bodies to the parser as bytes; decode anything else first."""
+    if codecs.lookup(encoding).name in {"utf-8", "ascii"}:
+        return content
+    return content.decode(encoding, errors="replace")
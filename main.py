@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import logging
 import sys
 from dataclasses import dataclass
+from typing import Any, Dict
 
+import orjson
 from dotenv import load_dotenv
 from httpx import HTTPError, RemoteProtocolError
 
@@ -41,6 +42,7 @@ class AppContext:
     summarizer: Summarizer
     service: WebSearchService
     query_cache: QueryCache | None
+    page_cache: QueryCache | None
 
 
 async def run() -> None:
@@ -96,7 +98,16 @@ async def create_context(config: AppConfig) -> AppContext:
     )
     crawler = Crawler(timeout_seconds=config.request_timeout_seconds)
     summarizer = Summarizer()
-    query_cache = QueryCache(config.cache_ttl_seconds) if config.enable_query_cache else None
+    query_cache = (
+        QueryCache(config.cache_ttl_seconds, max_entries=config.cache_max_entries)
+        if config.enable_query_cache
+        else None
+    )
+    page_cache = (
+        QueryCache(config.page_cache_ttl_seconds, max_entries=config.page_cache_max_entries)
+        if config.enable_page_cache
+        else None
+    )
     service = WebSearchService(
         rate_limiter=rate_limiter,
         telemetry=telemetry,
@@ -104,6 +115,7 @@ async def create_context(config: AppConfig) -> AppContext:
         summarizer=summarizer,
         crawler=crawler,
         query_cache=query_cache,
+        page_cache=page_cache,
         max_pages_to_fetch=3,
     )
     return AppContext(
@@ -115,6 +127,7 @@ async def create_context(config: AppConfig) -> AppContext:
         summarizer=summarizer,
         service=service,
         query_cache=query_cache,
+        page_cache=page_cache,
     )
 
 
@@ -161,7 +174,7 @@ async def run_cli_query(context: AppContext, args: argparse.Namespace) -> None:
     }
     if response.fetched_pages is not None:
         payload["fetched_pages"] = response.fetched_pages
-    print(json.dumps(payload, indent=2, ensure_ascii=False))
+    write_json(payload)
 
 
 async def run_fetch_url(context: AppContext, url: str) -> None:
@@ -176,7 +189,14 @@ async def run_fetch_url(context: AppContext, url: str) -> None:
         "text": result.get("text"),
         "html": result.get("html"),
     }
-    print(json.dumps(payload, indent=2, ensure_ascii=False))
+    write_json(payload)
+
+
+def write_json(payload: Dict[str, Any]) -> None:
+    """Write payload to stdout as indented UTF-8 JSON."""
+    sys.stdout.buffer.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
 
 
 async def run_http_server(context: AppContext) -> None:
@@ -194,7 +214,9 @@ async def run_http_server(context: AppContext) -> None:
         app=app,
         host="0.0.0.0",
         port=8000,
-        loop="asyncio",
+        # serve() runs on the already-running (uvloop when available) loop; "auto" keeps the
+        # same preference should uvicorn ever create the loop itself.
+        loop="auto",
         log_level="info",
     )
     server = uvicorn.Server(config)
@@ -222,5 +244,15 @@ async def run_stdio_transport(context: AppContext) -> None:
         sys.exit(1)
 
 
+def main() -> None:
+    """Run the server on uvloop when available, falling back to the stdlib event loop."""
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+        asyncio.run(run())
+    else:
+        uvloop.run(run())
+
+
 if __name__ == "__main__":
-    asyncio.run(run())
+    main()
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import asyncio
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Deque, Dict
+from typing import Dict
 
 
 class RateLimitExceeded(RuntimeError):
@@ -21,44 +20,48 @@ class RateLimiterConfig:
 
 
 class RateLimiter:
-    """Simple in-memory sliding window limiter with per-agent and global quotas."""
+    """Simple in-memory token bucket limiter with per-agent and global quotas.
+
+    The global bucket holds up to ``max_queries_per_minute`` tokens and refills
+    continuously at ``max_queries_per_minute / window_seconds`` tokens per second,
+    so short bursts are allowed while the long-run rate stays bounded.
+
+    Relies on cooperative single-thread scheduling instead of a lock: ``acquire``
+    and ``release`` never ``await`` while touching shared state, so each call
+    runs atomically on the event loop. Do not add ``await`` inside them.
+    """
 
     def __init__(self, config: RateLimiterConfig) -> None:
         self._config = config
         self._agent_active: Dict[str, int] = defaultdict(int)
-        self._global_window: Deque[float] = deque()
-        self._lock = asyncio.Lock()
+        self._capacity = float(config.max_queries_per_minute)
+        self._refill_rate = config.max_queries_per_minute / config.window_seconds
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
 
     async def acquire(self, agent_id: str) -> None:
         """Reserve capacity for the agent. Raises RateLimitExceeded on rejection."""
-        async with self._lock:
-            now = time.monotonic()
-            self._prune(now)
-
-            if self._agent_active[agent_id] >= self._config.max_concurrent_per_agent:
-                raise RateLimitExceeded(
-                    f"Agent {agent_id} exceeded concurrent allowance "
-                    f"({self._config.max_concurrent_per_agent})."
-                )
-
-            if len(self._global_window) >= self._config.max_queries_per_minute:
-                raise RateLimitExceeded(
-                    "Global web search quota exceeded "
-                    f"({self._config.max_queries_per_minute}/min)."
-                )
-
-            self._agent_active[agent_id] += 1
-            self._global_window.append(now)
+        if self._agent_active[agent_id] >= self._config.max_concurrent_per_agent:
+            raise RateLimitExceeded(
+                f"Agent {agent_id} exceeded concurrent allowance "
+                f"({self._config.max_concurrent_per_agent})."
+            )
+
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate
+        )
+        self._last_refill = now
+        if self._tokens < 1:
+            raise RateLimitExceeded(
+                "Global web search quota exceeded "
+                f"({self._config.max_queries_per_minute}/min)."
+            )
+
+        self._tokens -= 1
+        self._agent_active[agent_id] += 1
 
     async def release(self, agent_id: str) -> None:
         """Release the most recent slot for the agent."""
-        async with self._lock:
-            if self._agent_active[agent_id] > 0:
-                self._agent_active[agent_id] -= 1
-
-    def _prune(self, now: float) -> None:
-        """Remove timestamps outside the sliding window."""
-        window_start = now - self._config.window_seconds
-
-        while self._global_window and self._global_window[0] < window_start:
-            self._global_window.popleft()
+        if self._agent_active[agent_id] > 0:
+            self._agent_active[agent_id] -= 1
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import httpx
 import logging
-from urllib.parse import urlparse, parse_qs
-
-from bs4 import BeautifulSoup
-
-
-@dataclass
+import re
+from urllib.parse import unquote_plus
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+# Keep idle connections around between queries so repeat requests skip the TLS handshake.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+# DuckDuckGo wraps result links as https://duckduckgo.com/l/?uddg=<encoded target>&rut=...
+_DDG_REDIRECT_RE = re.compile(
+    r"^https?://(?:[^/?#]*\.)?duckduckgo\.com/l/[^?#]*\?(?:[^#]*?&)?uddg=([^&#]+)",
+    re.IGNORECASE,
+)
+_TOKEN_RE = re.compile(r"\w+")
+# Result containers and their parts in one selector, so the tree is searched once per page.
+_RESULT_PARTS_SELECTOR = (
+    "div.result, div.result a.result__a, "
+    "div.result div.result__snippet, div.result a.result__snippet"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """Normalized representation of a search hit."""
 
@@ -49,12 +68,7 @@ class SearchClient:
 
         self._client: httpx.AsyncClient | None = None
         if not self._use_stub:
-            headers = {"User-Agent": self._user_agent}
-            self._client = httpx.AsyncClient(
-                timeout=self._timeout,
-                headers=headers,
-                follow_redirects=True,
-            )
+            self._client = self._build_client()
 
     async def search(self, query: str, *, max_results: int = 5) -> List[SearchResult]:
         """Execute query and return normalized results."""
@@ -62,12 +76,7 @@ class SearchClient:
             return self._search_stub(query, max_results)
 
         if not self._client:
-            headers = {"User-Agent": self._user_agent}
-            self._client = httpx.AsyncClient(
-                timeout=self._timeout,
-                headers=headers,
-                follow_redirects=True,
-            )
+            self._client = self._build_client()
 
         if self._provider == "duckduckgo_html":
             html_results = await self._search_duckduckgo_html(query, max_results)
@@ -88,6 +97,15 @@ class SearchClient:
         if self._client:
             await self._client.aclose()
 
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client shared by every search request."""
+        return httpx.AsyncClient(
+            timeout=self._timeout,
+            headers={"User-Agent": self._user_agent},
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=_POOL_LIMITS, retries=2),
+        )
+
     def _parse_results(self, payload: Dict[str, Any], limit: int) -> List[SearchResult]:
         """Convert provider payload to normalized results."""
         web_pages = payload.get("webPages", {}).get("value", [])
@@ -103,12 +121,18 @@ class SearchClient:
         return results
 
     def _search_stub(self, query: str, max_results: int) -> List[SearchResult]:
-        q = query.lower()
-        matches = [
-            result
-            for result in _DEFAULT_STUB_RESULTS
-            if q in result.title.lower() or q in result.snippet.lower()
-        ]
+        """Stub results containing every whole word of the query, in stub order.
+
+        Falls back to the full stub list when any word (partial words included) has no match.
+        """
+        positions: Optional[Set[int]] = None
+        for token in _TOKEN_RE.findall(query.lower()):
+            hits = _STUB_TOKENS.get(token)
+            if not hits:
+                positions = None
+                break
+            positions = hits if positions is None else positions & hits
+        matches = [_DEFAULT_STUB_RESULTS[i] for i in sorted(positions)] if positions else []
         selection = matches if matches else _DEFAULT_STUB_RESULTS
         return selection[:max_results]
 
@@ -116,12 +140,7 @@ class SearchClient:
         self, query: str, max_results: int
     ) -> List[SearchResult]:
         if not self._client:
-            headers = {"User-Agent": self._user_agent}
-            self._client = httpx.AsyncClient(
-                timeout=self._timeout,
-                headers=headers,
-                follow_redirects=True,
-            )
+            self._client = self._build_client()
 
         params = {"q": query, "kl": self._language}
         response = await self._client.get(self._endpoint_url, params=params)
@@ -132,19 +151,12 @@ class SearchClient:
             )
             return []
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        tree = LexborHTMLParser(response.text)
         results: List[SearchResult] = []
-        for result_div in soup.select("div.result"):
-            link = result_div.select_one("a.result__a")
-            if not link:
-                continue
-            title = link.get_text(strip=True)
-            url = link.get("href") or ""
-            url = self._normalize_url(url)
-            snippet_tag = result_div.select_one("div.result__snippet") or result_div.select_one(
-                "a.result__snippet"
-            )
-            snippet = snippet_tag.get_text(" ", strip=True) if snippet_tag else ""
+        for link, snippet_tag in _result_parts(tree):
+            title = link.text(strip=True)
+            url = self._normalize_url(link.attributes.get("href") or "")
+            snippet = " ".join(snippet_tag.text(separator=" ").split()) if snippet_tag else ""
 
             if not url or not title:
                 continue
@@ -164,12 +176,9 @@ class SearchClient:
         # DuckDuckGo often returns protocol-relative links
         if raw_url.startswith("//"):
             raw_url = "https:" + raw_url
-        parsed = urlparse(raw_url)
-        if parsed.netloc.endswith("duckduckgo.com") and parsed.path.startswith("/l/"):
-            params = parse_qs(parsed.query)
-            uddg = params.get("uddg")
-            if uddg:
-                return uddg[0]
+        match = _DDG_REDIRECT_RE.match(raw_url)
+        if match:
+            return unquote_plus(match.group(1))
         return raw_url
 
 
@@ -200,3 +209,45 @@ _DEFAULT_STUB_RESULTS: List[SearchResult] = [
         snippet="OpenTelemetry instrumentation examples for Python services.",
     ),
 ]
+
+
+def _result_parts(
+    tree: LexborHTMLParser,
+) -> Iterator[Tuple[LexborNode, Optional[LexborNode]]]:
+    """Yield (title link, snippet) for every ``div.result`` that has a title link.
+
+    Selector matches come back in document order, so each result container is
+    followed by its own parts. Like the per-result lookups this replaces, the first
+    title link wins and ``div.result__snippet`` is preferred over ``a.result__snippet``.
+    """
+    link: Optional[LexborNode] = None
+    div_snippet: Optional[LexborNode] = None
+    a_snippet: Optional[LexborNode] = None
+    for node in tree.css(_RESULT_PARTS_SELECTOR):
+        classes = (node.attributes.get("class") or "").split()
+        if node.tag == "div" and "result" in classes:
+            if link is not None:
+                yield link, div_snippet if div_snippet is not None else a_snippet
+            link = div_snippet = a_snippet = None
+        elif node.tag == "a" and "result__a" in classes:
+            if link is None:
+                link = node
+        elif node.tag == "div":
+            if div_snippet is None:
+                div_snippet = node
+        elif a_snippet is None:
+            a_snippet = node
+    if link is not None:
+        yield link, div_snippet if div_snippet is not None else a_snippet
+
+
+def _index_tokens(results: List[SearchResult]) -> Dict[str, Set[int]]:
+    """Map each lower-cased word of a result's title and snippet to the result positions."""
+    index: Dict[str, Set[int]] = defaultdict(set)
+    for position, result in enumerate(results):
+        for token in _TOKEN_RE.findall(f"{result.title} {result.snippet}".lower()):
+            index[token].add(position)
+    return dict(index)
+
+
+_STUB_TOKENS = _index_tokens(_DEFAULT_STUB_RESULTS)
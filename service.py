@@ -1,28 +1,51 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
 
+import orjson
 from httpx import HTTPError
 
 from cache import QueryCache
 from crawler import Crawler, FetchedPage
 from rate_limiter import RateLimitExceeded, RateLimiter
 from search_client import SearchClient, SearchResult
-from summarizer import Summarizer
+from summarizer import Summarizer, Summary
 from telemetry import Telemetry
 
 logger = logging.getLogger(__name__)
 
+# Character limits applied to query text previews and to fetch_page responses.
+_PREVIEW_TEXT_CHARS = 8000
+_PAGE_TEXT_CHARS = 200000
+# A character takes at most four bytes in any page encoding, so this many bytes per
+# character always cover the markup that fetch_page returns.
+_MAX_BYTES_PER_CHAR = 4
 
-@dataclass
+
+@dataclass(slots=True)
 class QueryResponse:
     """Response structure returned to MCP agents."""
 
-    summary: Dict[str, Any]
+    summary: Summary
     results: List[Dict[str, Any]]
     fetched_pages: Optional[List[Dict[str, Any]]] = None
+    _encoded: Dict[str, bytes] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def encoded(self, shape: str, render: Callable[[QueryResponse], Dict[str, Any]]) -> bytes:
+        """Return ``render(self)`` as JSON bytes, serialised once per shape.
+
+        Responses are shared through the query cache, so cache hits reuse the stored body.
+        """
+        body = self._encoded.get(shape)
+        if body is None:
+            body = orjson.dumps(render(self))
+            self._encoded[shape] = body
+        return body
 
 
 class WebSearchService:
@@ -37,6 +60,7 @@ class WebSearchService:
         summarizer: Summarizer,
         crawler: Optional[Crawler] = None,
         query_cache: Optional[QueryCache] = None,
+        page_cache: Optional[QueryCache] = None,
         max_pages_to_fetch: int = 3,
     ) -> None:
         self._rate_limiter = rate_limiter
@@ -45,7 +69,9 @@ class WebSearchService:
         self._summarizer = summarizer
         self._crawler = crawler
         self._cache = query_cache
+        self._page_cache = page_cache
         self._max_pages_to_fetch = max_pages_to_fetch
+        self._inflight: Dict[str, asyncio.Task[QueryResponse]] = {}
 
     async def query(
         self,
@@ -62,6 +88,14 @@ class WebSearchService:
                 logger.debug("Cache hit for query='%s'", query)
                 return cached
 
+        # Identical queries already running are joined without consuming rate-limit capacity.
+        # Every caller, the one that started the task included, awaits it through shield()
+        # so cancelling one caller never cancels the query for the others.
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            logger.debug("Joining in-flight query='%s'", query)
+            return await asyncio.shield(inflight)
+
         try:
             await self._rate_limiter.acquire(agent_id)
         except RateLimitExceeded:
@@ -69,6 +103,46 @@ class WebSearchService:
             self._telemetry.record_rate_limit_drop("rate_limiter")
             raise
 
+        task = asyncio.create_task(
+            self._run_query(
+                cache_key=cache_key, agent_id=agent_id, query=query, max_results=max_results
+            )
+        )
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda done: self._forget_inflight(cache_key, done))
+        return await asyncio.shield(task)
+
+    async def _run_query(
+        self,
+        *,
+        cache_key: str,
+        agent_id: str,
+        query: str,
+        max_results: int,
+    ) -> QueryResponse:
+        """Run the pipeline, holding the agent's rate-limit slot until it finishes."""
+        try:
+            return await self._search(
+                cache_key=cache_key, agent_id=agent_id, query=query, max_results=max_results
+            )
+        finally:
+            await self._rate_limiter.release(agent_id)
+
+    def _forget_inflight(self, cache_key: str, task: asyncio.Task[QueryResponse]) -> None:
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # Mark any exception as retrieved so asyncio does not warn when every caller left.
+            task.exception()
+
+    async def _search(
+        self,
+        *,
+        cache_key: str,
+        agent_id: str,
+        query: str,
+        max_results: int,
+    ) -> QueryResponse:
         results: List[SearchResult] = []
         fetched_pages: List[FetchedPage] = []
 
@@ -80,15 +154,9 @@ class WebSearchService:
         except HTTPError as exc:
             logger.error("Search provider error: %s", exc, exc_info=True)
             raise
-        finally:
-            await self._rate_limiter.release(agent_id)
 
-        summary = self._summarizer.build_summary(results)
         response = QueryResponse(
-            summary={
-                "overview": summary.overview,
-                "highlights": summary.highlights,
-            },
+            summary=self._summarizer.build_summary(results),
             results=[
                 {"title": item.title, "url": item.url, "snippet": item.snippet}
                 for item in results
@@ -98,7 +166,7 @@ class WebSearchService:
                     "url": page.url,
                     "status_code": page.status_code,
                     "content_type": page.content_type,
-                    "text_preview": (page.text[:8000] if page.text else None),
+                    "text_preview": page.text or None,
                 }
                 for page in fetched_pages
             ]
@@ -113,27 +181,82 @@ class WebSearchService:
         if not self._crawler:
             return []
 
+        targets = results[: self._max_pages_to_fetch]
+        outcomes = await asyncio.gather(
+            *(
+                self._fetch_page(
+                    self._crawler, result.url, max_text_chars=_PREVIEW_TEXT_CHARS, keep_html=False
+                )
+                for result in targets
+            ),
+            return_exceptions=True,
+        )
+
         pages: List[FetchedPage] = []
-        for result in results[: self._max_pages_to_fetch]:
-            try:
-                page = await self._crawler.fetch(result.url)
-                pages.append(page)
-            except HTTPError as exc:
-                logger.warning("Failed to fetch URL %s: %s", result.url, exc)
+        for result, outcome in zip(targets, outcomes):
+            if isinstance(outcome, HTTPError):
+                logger.warning("Failed to fetch URL %s: %s", result.url, outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                pages.append(outcome)
         return pages
 
     async def fetch_page(self, url: str) -> Optional[Dict[str, Any]]:
         if not self._crawler:
             return None
-        page = await self._crawler.fetch(url)
+        page = await self._fetch_page(
+            self._crawler, url, max_text_chars=_PAGE_TEXT_CHARS, keep_html=True
+        )
+        html = page.html
         return {
             "url": page.url,
             "status_code": page.status_code,
             "content_type": page.content_type,
-            "text": page.text[:200000] if page.text else None,
-            "html": page.html[:200000] if page.html else None,
+            "text": page.text or None,
+            "html": html[:_PAGE_TEXT_CHARS] if html else None,
         }
 
+    async def _fetch_page(
+        self,
+        crawler: Crawler,
+        url: str,
+        *,
+        max_text_chars: int,
+        keep_html: bool,
+    ) -> FetchedPage:
+        """Fetch url through the page cache; repeat URLs across queries skip the network."""
+        if not self._page_cache:
+            return await crawler.fetch(url, max_text_chars=max_text_chars, keep_html=keep_html)
+
+        # Previews and full pages are stored separately since they keep different amounts of data.
+        variant = f"{max_text_chars}:{int(keep_html)}"
+        cached: Optional[FetchedPage] = self._page_cache.get(f"{variant}:{url}")
+        if cached:
+            logger.debug("Page cache hit for url='%s'", url)
+            return cached
+
+        page = await crawler.fetch(url, max_text_chars=max_text_chars, keep_html=keep_html)
+        if page.status_code < 400:
+            entry = _trim_for_cache(page, max_text_chars)
+            self._page_cache.set(f"{variant}:{url}", entry)
+            if page.url != url:
+                self._page_cache.set(f"{variant}:{page.url}", entry)
+        return page
+
     @staticmethod
     def _build_cache_key(*, query: str, max_results: int) -> str:
-        return f"{query.lower().strip()}::{max_results}"
+        normalized = f"{query.lower().strip()}::{max_results}"
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _trim_for_cache(page: FetchedPage, max_text_chars: int) -> FetchedPage:
+    """Copy of page keeping only the body bytes a cached response can still return.
+
+    Non-text bodies are never decoded, so they are dropped; text bodies are cut to the
+    bytes that can hold the first ``max_text_chars`` characters.
+    """
+    body = page.content[: max_text_chars * _MAX_BYTES_PER_CHAR] if page.is_text else b""
+    if len(body) == len(page.content):
+        return page
+    return dataclasses.replace(page, content=body)
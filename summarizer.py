@@ -1,64 +1,127 @@
 from __future__ import annotations
 
+import heapq
+import re
 from dataclasses import dataclass
-from typing import Iterable, List, Tuple
-
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from search_client import SearchResult
 
+_DOMAIN_BOOSTS: Tuple[Tuple[str, float], ...] = (
+    ("weather.com", 150.0),
+    ("bbc.com", 120.0),
+    ("accuweather.com", 100.0),
+    ("reuters.com", 90.0),
+    ("guardian", 80.0),
+)
+_PHRASE_BONUSES: Tuple[Tuple[str, float], ...] = (("forecast", 40.0), ("current", 20.0))
+
+
+# Optional scheme followed by "//authority", mirroring what urlparse treats as the netloc.
+_NETLOC_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
+
+
+def _netloc(url: str) -> str:
+    """Lower-cased ``urlparse(url).netloc`` without building a full ParseResult."""
+    match = _NETLOC_RE.match(url)
+    return match.group(1).lower() if match else ""
+
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _domain_bonus(domain: str) -> float:
+    """Bonus of the first listed keyword found in ``domain``.
+
+    Declaration order doubles as priority ("weather.com" wins inside
+    "accuweather.com"). Memoised because large batches repeat a few domains.
+    """
+    for keyword, bonus in _DOMAIN_BOOSTS:
+        if keyword in domain:
+            return bonus
+    return 0.0
+
+
+@dataclass(frozen=True, slots=True)
 class Summary:
     """Structured summary returned to MCP agents."""
 
     overview: str
-    highlights: List[str]
+    highlights: Tuple[str, ...]
+
+
+# Immutable, so every query without usable snippets can share it.
+_EMPTY_SUMMARY = Summary(overview="No concise results matched this query.", highlights=())
 
 
 class Summarizer:
     """Combines search snippets into a lightweight summary."""
 
-    def build_summary(self, results: Iterable[SearchResult]) -> Summary:
-        scored_snippets: List[Tuple[float, str]] = []
-        seen = set()
+    def build_summary(
+        self, results: Iterable[SearchResult], *, max_highlights: int = 3
+    ) -> Summary:
+        # Sized inputs can be rejected before any scoring machinery is set up; other
+        # iterables fall through to the empty check after the loop.
+        if isinstance(results, (list, tuple)) and not results:
+            return _EMPTY_SUMMARY
+        if max_highlights <= 0:
+            return self._build_overview(results)
+
+        # Bounded min-heap of the best ``max_highlights + 1`` snippets, filled while
+        # scoring. ``-index`` breaks score ties in favour of earlier snippets without
+        # ever comparing strings.
+        capacity = max_highlights + 1
+        heap: List[Tuple[float, int, str]] = []
+        for index, (score, snippet) in enumerate(self._iter_scored(results)):
+            if len(heap) < capacity:
+                heapq.heappush(heap, (score, -index, snippet))
+            else:
+                heapq.heappushpop(heap, (score, -index, snippet))
+
+        if not heap:
+            return _EMPTY_SUMMARY
+
+        top = sorted(heap, reverse=True)
+        overview = top[0][2]
+        highlights = tuple(snippet for _score, _index, snippet in top[1:])
+        return Summary(overview=overview, highlights=highlights)
+
+    def _build_overview(self, results: Iterable[SearchResult]) -> Summary:
+        """Overview-only summary: a single argmax scan, no shortlist kept."""
+        best_score = float("-inf")
+        best_snippet = None
+        for score, snippet in self._iter_scored(results):
+            # Strict comparison keeps the earliest snippet on ties, like the ranked path.
+            if score > best_score:
+                best_score, best_snippet = score, snippet
+        if best_snippet is None:
+            return _EMPTY_SUMMARY
+        return Summary(overview=best_snippet, highlights=())
+
+    def _iter_scored(self, results: Iterable[SearchResult]) -> Iterator[Tuple[float, str]]:
+        """Yield ``(score, snippet)`` for each non-empty, case-insensitively unique snippet."""
+        # Fingerprint -> first snippet with that fingerprint. Keeping the snippet (which
+        # the caller holds anyway) instead of its lowercase copy frees those copies; the
+        # exact comparison only runs on a fingerprint hit.
+        seen: Dict[int, str] = {}
         for result in results:
+            # No "already clean" pre-checks: strip() returns the same object when there
+            # is nothing to trim, and testing isascii()/islower() costs more than lower().
             snippet = (result.snippet or "").strip()
             if not snippet:
                 continue
             normalized = snippet.lower()
-            if normalized in seen:
+            fingerprint = hash(normalized)
+            previous = seen.get(fingerprint)
+            if previous is not None and previous.lower() == normalized:
                 continue
-            seen.add(normalized)
-
-            score = self._score_snippet(snippet, result.url)
-            scored_snippets.append((score, snippet))
-
-        if not scored_snippets:
-            return Summary(overview="No concise results matched this query.", highlights=[])
-
-        scored_snippets.sort(key=lambda item: item[0], reverse=True)
-
-        overview = scored_snippets[0][1]
-        highlights = [snippet for _score, snippet in scored_snippets[1:4]]
-        return Summary(overview=overview, highlights=highlights)
+            seen.setdefault(fingerprint, snippet)
+            yield self._score_snippet(snippet, normalized, result.url), snippet
 
-    def _score_snippet(self, snippet: str, url: str) -> float:
-        score = len(snippet)
-        domain = urlparse(url).netloc.lower()
-        boosts = {
-            "weather.com": 150.0,
-            "bbc.com": 120.0,
-            "accuweather.com": 100.0,
-            "reuters.com": 90.0,
-            "guardian": 80.0,
-        }
-        for keyword, bonus in boosts.items():
-            if keyword in domain:
+    def _score_snippet(self, snippet: str, snippet_lower: str, url: str) -> float:
+        score = float(len(snippet))
+        score += _domain_bonus(_netloc(url))
+        # Each phrase counts once however often it occurs.
+        for phrase, bonus in _PHRASE_BONUSES:
+            if phrase in snippet_lower:
                 score += bonus
-                break
-        if "forecast" in snippet.lower():
-            score += 40.0
-        if "current" in snippet.lower():
-            score += 20.0
         return score
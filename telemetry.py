@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import atexit
+import threading
 import time
-from contextlib import contextmanager
-from typing import Iterator, Optional
+import weakref
+from types import TracebackType
+from typing import Dict, List, Optional, Type
 
 from prometheus_client import Counter, Histogram
 
+_monotonic = time.monotonic
+
+# A thread pushes its batch to QUERY_TOTAL after this many queries, or on the first
+# query once this many seconds have passed since its previous push.
+_FLUSH_THRESHOLD = 64
+_FLUSH_INTERVAL_SECONDS = 10.0
 
 QUERY_TOTAL = Counter(
     "web_search_queries_total",
@@ -16,7 +25,7 @@ QUERY_TOTAL = Counter(
 QUERY_LATENCY = Histogram(
     "web_search_query_latency_seconds",
     "Latency of web search queries.",
-    buckets=(0.5, 1, 2, 4, 6, 8, 10, 15, 30),
+    buckets=(1, 4, 10, 30),
 )
 
 RATE_LIMIT_DROPS = Counter(
@@ -26,23 +35,120 @@ RATE_LIMIT_DROPS = Counter(
 )
 
 
+class _PendingCounts:
+    """Per-thread query counts not yet pushed to Prometheus."""
+
+    __slots__ = ("counts", "total", "flushed_at")
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.total = 0
+        # Never flushed, so a thread's first query is pushed straight away.
+        self.flushed_at = float("-inf")
+
+
 class Telemetry:
-    """Facade around Prometheus metrics helpers."""
+    """Facade around Prometheus metrics helpers.
+
+    Query counts are batched per thread and pushed to ``QUERY_TOTAL`` every
+    ``_FLUSH_THRESHOLD`` queries or ``_FLUSH_INTERVAL_SECONDS``, whichever comes
+    first, so the counter's lock is taken once per batch rather than once per
+    query. Only the owning thread touches its batch while running: ``flush`` pushes
+    the calling thread's counts, and every thread's leftovers are pushed at
+    interpreter exit.
+    """
+
+    def __init__(self) -> None:
+        # Resolved label children; prometheus_client keeps them alive anyway, so
+        # caching them here only skips the per-event ``labels()`` lookup.
+        self._counter_cache: Dict[str, Counter] = {}
+        self._drop_cache: Dict[str, Counter] = {}
+        self._pending = threading.local()
+        self._all_pending: List[_PendingCounts] = []
+        self._all_pending_lock = threading.Lock()
+        _INSTANCES.add(self)
 
     def record_rate_limit_drop(self, reason: str) -> None:
-        RATE_LIMIT_DROPS.labels(reason=reason).inc()
+        counter = self._drop_cache.get(reason)
+        if counter is None:
+            counter = self._drop_cache[reason] = RATE_LIMIT_DROPS.labels(reason=reason)
+        counter.inc()
 
     def record_query(self, agent_id: str, duration_seconds: float) -> None:
-        QUERY_TOTAL.labels(agent_id=agent_id).inc()
+        pending = self._thread_pending()
+        counts = pending.counts
+        counts[agent_id] = counts.get(agent_id, 0) + 1
+        pending.total += 1
+        if (
+            pending.total >= _FLUSH_THRESHOLD
+            or _monotonic() - pending.flushed_at >= _FLUSH_INTERVAL_SECONDS
+        ):
+            self._flush_pending(pending)
         QUERY_LATENCY.observe(duration_seconds)
 
-    @contextmanager
-    def measure_query(self, agent_id: Optional[str] = None) -> Iterator[None]:
+    def flush(self) -> None:
+        """Push the calling thread's batched query counts to Prometheus."""
+        pending = getattr(self._pending, "batch", None)
+        if pending is not None:
+            self._flush_pending(pending)
+
+    def _flush_all_threads(self) -> None:
+        """Push every thread's batch; only safe once other threads stop recording."""
+        with self._all_pending_lock:
+            batches = list(self._all_pending)
+        for pending in batches:
+            self._flush_pending(pending)
+
+    def _thread_pending(self) -> _PendingCounts:
+        pending = getattr(self._pending, "batch", None)
+        if pending is None:
+            pending = self._pending.batch = _PendingCounts()
+            with self._all_pending_lock:
+                self._all_pending.append(pending)
+        return pending
+
+    def _flush_pending(self, pending: _PendingCounts) -> None:
+        # Swap in a fresh dict first so increments made meanwhile land in the next batch.
+        counts, pending.counts, pending.total = pending.counts, {}, 0
+        pending.flushed_at = _monotonic()
+        for agent_id, amount in counts.items():
+            counter = self._counter_cache.get(agent_id)
+            if counter is None:
+                counter = self._counter_cache[agent_id] = QUERY_TOTAL.labels(agent_id=agent_id)
+            counter.inc(amount)
+
+    def measure_query(self, agent_id: Optional[str] = None) -> _QueryTimer:
         """Context manager to time a web search query."""
-        start = time.monotonic()
-        try:
-            yield
-        finally:
-            duration = time.monotonic() - start
-            if agent_id:
-                self.record_query(agent_id, duration)
+        return _QueryTimer(self, agent_id)
+
+
+_INSTANCES: weakref.WeakSet[Telemetry] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    for telemetry in list(_INSTANCES):
+        telemetry._flush_all_threads()
+
+
+class _QueryTimer:
+    """Times one query; a plain class avoids the generator that @contextmanager allocates."""
+
+    __slots__ = ("_telemetry", "_agent_id", "_start")
+
+    def __init__(self, telemetry: Telemetry, agent_id: Optional[str]) -> None:
+        self._telemetry = telemetry
+        self._agent_id = agent_id
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = _monotonic()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._agent_id:
+            self._telemetry.record_query(self._agent_id, _monotonic() - self._start)
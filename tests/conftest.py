@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import pytest
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module; tests advance ``now`` by hand."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    return FakeClock()
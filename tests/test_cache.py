@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+
+import cache
+from cache import QueryCache
+from tests.conftest import FakeClock
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    query_cache = QueryCache(ttl_seconds=60, max_entries=2)
+
+    query_cache.set("a", 1)
+    query_cache.set("b", 2)
+    assert query_cache.get("a") == 1
+    query_cache.set("c", 3)
+
+    assert query_cache.get("b") is None
+    assert query_cache.get("a") == 1
+    assert query_cache.get("c") == 3
+
+
+def test_sweep_drops_expired_entries(
+    monkeypatch: pytest.MonkeyPatch, fake_clock: FakeClock
+) -> None:
+    monkeypatch.setattr(cache, "time", fake_clock)
+    query_cache = QueryCache(ttl_seconds=10)
+
+    query_cache.set("stale", "value")
+    fake_clock.now = 11.0
+    for index in range(cache._SWEEP_INTERVAL - 1):
+        query_cache.set(f"fresh-{index}", index)
+
+    assert len(query_cache._store) == cache._SWEEP_INTERVAL - 1
+    assert query_cache.get("stale") is None
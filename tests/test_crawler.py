@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import httpx
+import pytest
+
+from crawler import Crawler
+
+
+def _crawler(handler: Callable[[httpx.Request], httpx.Response]) -> Crawler:
+    crawler = Crawler()
+    crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return crawler
+
+
+@pytest.mark.asyncio
+async def test_fetch_excludes_script_and_style_text() -> None:
+    body = (
+        b"<html><head><style>p { color: red; }</style></head>"
+        b"<body><p>caf\xc3\xa9 <b>x</b></p><script>var a=1;</script>"
+        b"<noscript>enable js</noscript><template><p>hidden</p></template></body></html>"
+    )
+    crawler = _crawler(
+        lambda request: httpx.Response(
+            200, content=body, headers={"content-type": "text/html; charset=utf-8"}
+        )
+    )
+
+    page = await crawler.fetch("https://example.com/")
+
+    assert page.text == "café x"
+    await crawler.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_decodes_non_utf8_pages() -> None:
+    body = "<html><body><p>Café crème à Paris</p></body></html>".encode("latin-1")
+    crawler = _crawler(
+        lambda request: httpx.Response(
+            200, content=body, headers={"content-type": "text/html; charset=iso-8859-1"}
+        )
+    )
+
+    page = await crawler.fetch("https://example.com/fr")
+
+    assert page.text == "Café crème à Paris"
+    assert page.html is not None
+    assert "Café crème" in page.html
+    await crawler.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_skips_text_and_html_for_non_text_content() -> None:
+    crawler = _crawler(
+        lambda request: httpx.Response(
+            200, content=b"%PDF-1.7 binary", headers={"content-type": "application/pdf"}
+        )
+    )
+
+    page = await crawler.fetch("https://example.com/report.pdf")
+
+    assert page.text is None
+    assert page.html is None
+    assert page.content == b"%PDF-1.7 binary"
+    await crawler.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_truncates_text_and_drops_body() -> None:
+    body = b"<html><body><p>" + b"word " * 50 + b"</p></body></html>"
+    crawler = _crawler(
+        lambda request: httpx.Response(
+            200, content=body, headers={"content-type": "text/html; charset=utf-8"}
+        )
+    )
+
+    page = await crawler.fetch("https://example.com/", max_text_chars=9, keep_html=False)
+
+    assert page.text == "word word"
+    assert page.content == b""
+    assert page.html is None
+    await crawler.close()
@@ -1,28 +1,33 @@
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 
 import pytest
 
 from search_client import SearchClient
 
+MOCKS_DIR = Path(__file__).parent / "mocks"
 
-@pytest.mark.asyncio
-async def test_duckduckgo_html_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
-    sample_html = Path("tests/mocks/duckduckgo_weather.html").read_text(encoding="utf-8")
 
-    class StubResponse:
-        status_code = 200
-        text = sample_html
+class StubResponse:
+    status_code = 200
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
 
-    class StubClient:
-        async def get(self, *_args, **_kwargs):
-            return StubResponse()
+class StubClient:
+    def __init__(self, text: str) -> None:
+        self._response = StubResponse(text)
 
-        async def aclose(self) -> None:  # pragma: no cover - not used in this test
-            return None
+    async def get(self, *_args, **_kwargs) -> StubResponse:
+        return self._response
 
+    async def aclose(self) -> None:  # pragma: no cover - not used in these tests
+        return None
+
+
+def _html_client(html: str) -> SearchClient:
     client = SearchClient(
         endpoint_url="https://html.duckduckgo.com/html/",
         api_key=None,
@@ -30,8 +35,23 @@ async def test_duckduckgo_html_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
         use_stub_data=False,
         language="us-en",
     )
+    client._client = StubClient(html)  # type: ignore[attr-defined]
+    return client
+
 
-    client._client = StubClient()  # type: ignore[attr-defined]
+@pytest.fixture(scope="module")
+def weather_html() -> str:
+    return (MOCKS_DIR / "duckduckgo_weather.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def redirect_html() -> str:
+    return (MOCKS_DIR / "duckduckgo_redirect.html").read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_duckduckgo_html_parsing(weather_html: str) -> None:
+    client = _html_client(weather_html)
 
     results = await client.search("Current weather in London", max_results=5)
 
@@ -50,32 +70,41 @@ async def test_duckduckgo_html_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_duckduckgo_html_redirect_normalization() -> None:
-    sample_html = Path("tests/mocks/duckduckgo_redirect.html").read_text(encoding="utf-8")
+async def test_duckduckgo_html_redirect_normalization(redirect_html: str) -> None:
+    client = _html_client(redirect_html)
 
-    class StubResponse:
-        status_code = 200
-        text = sample_html
+    results = await client.search("Example article", max_results=1)
+    assert len(results) == 1
+    assert results[0].url == "https://example.com/article"
 
-    class StubClient:
-        async def get(self, *_args, **_kwargs):
-            return StubResponse()
+    await client.close()
 
-        async def aclose(self) -> None:  # pragma: no cover - not used in this test
-            return None
 
+@pytest.mark.parametrize(
+    ("raw_url", "expected"),
+    [
+        (
+            "//duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.com%2Fa%3Fq%3D1&rut=abc",
+            "https://example.com/a?q=1",
+        ),
+        (
+            "https://duckduckgo.com/l/?kh=-1&uddg=https%3A%2F%2Fexample.com%2Fb",
+            "https://example.com/b",
+        ),
+        ("https://duckduckgo.com/l/?rut=abc", "https://duckduckgo.com/l/?rut=abc"),
+        (
+            "https://duckduckgo.com/?uddg=https%3A%2F%2Fexample.com",
+            "https://duckduckgo.com/?uddg=https%3A%2F%2Fexample.com",
+        ),
+        ("https://example.com/l/?uddg=x", "https://example.com/l/?uddg=x"),
+        ("", ""),
+    ],
+)
+def test_normalize_url(raw_url: str, expected: str) -> None:
     client = SearchClient(
         endpoint_url="https://html.duckduckgo.com/html/",
         api_key=None,
-        provider="duckduckgo_html",
-        use_stub_data=False,
-        language="us-en",
+        use_stub_data=True,
     )
 
-    client._client = StubClient()  # type: ignore[attr-defined]
-
-    results = await client.search("Example article", max_results=1)
-    assert len(results) == 1
-    assert results[0].url == "https://example.com/article"
-
-    await client.close()
+    assert client._normalize_url(raw_url) == expected
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from rate_limiter import RateLimitExceeded, RateLimiter, RateLimiterConfig
+from tests.conftest import FakeClock
 
 
 @pytest.mark.asyncio
@@ -30,7 +31,11 @@ async def test_concurrent_limit_per_agent() -> None:
 
 
 @pytest.mark.asyncio
-async def test_global_rate_limit_window(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_global_rate_limit_window(
+    monkeypatch: pytest.MonkeyPatch, fake_clock: FakeClock
+) -> None:
+    fake_clock.now = 100.0
+    monkeypatch.setattr("rate_limiter.time", fake_clock)
     limiter = RateLimiter(
         RateLimiterConfig(
             max_concurrent_per_agent=2,
@@ -39,9 +44,30 @@ async def test_global_rate_limit_window(monkeypatch: pytest.MonkeyPatch) -> None
         )
     )
 
-    timestamps = iter([100.0, 161.0])
-    monkeypatch.setattr("rate_limiter.time.monotonic", lambda: next(timestamps))
-
     await limiter.acquire("agent")
     await limiter.release("agent")
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire("agent")
+
+    fake_clock.now = 161.0
     await limiter.acquire("agent")
+
+
+@pytest.mark.asyncio
+async def test_global_bucket_allows_burst_then_refills(
+    monkeypatch: pytest.MonkeyPatch, fake_clock: FakeClock
+) -> None:
+    monkeypatch.setattr("rate_limiter.time", fake_clock)
+    limiter = RateLimiter(
+        RateLimiterConfig(max_concurrent_per_agent=10, max_queries_per_minute=3)
+    )
+
+    for _ in range(3):
+        await limiter.acquire("agent")
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire("agent")
+
+    fake_clock.now = 20.0
+    await limiter.acquire("agent")
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire("agent")
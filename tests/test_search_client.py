@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from search_client import _DEFAULT_STUB_RESULTS, SearchClient
+
+
+def _stub_titles(query: str, max_results: int = 5) -> List[str]:
+    client = SearchClient(endpoint_url="", api_key=None, use_stub_data=True)
+    return [result.title for result in client._search_stub(query, max_results)]
+
+
+def test_stub_search_requires_every_word_and_keeps_stub_order() -> None:
+    assert _stub_titles("MCP checklist") == [
+        "Observability checklist for MCP servers",
+        "Security review template for integration projects",
+    ]
+
+
+@pytest.mark.parametrize("query", ["security banana", "secur", ""])
+def test_stub_search_falls_back_to_default_results(query: str) -> None:
+    assert _stub_titles(query, max_results=3) == [
+        result.title for result in _DEFAULT_STUB_RESULTS[:3]
+    ]
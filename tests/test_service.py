@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 from typing import List
 
+import httpx
 import pytest
 
+import service as service_module
 from cache import QueryCache
+from crawler import FetchedPage
 from rate_limiter import RateLimiter, RateLimiterConfig
 from search_client import SearchResult
 from service import QueryResponse, WebSearchService
-from summarizer import Summarizer
+from summarizer import Summarizer, Summary
 from telemetry import Telemetry
 
 
@@ -33,6 +37,45 @@ class StubSearchClient:
         return self._results[:max_results]
 
 
+class GatedSearchClient(StubSearchClient):
+    def __init__(self, results: List[SearchResult]) -> None:
+        super().__init__(results)
+        self.release = asyncio.Event()
+
+    async def search(self, query: str, max_results: int = 5) -> List[SearchResult]:
+        self.calls += 1
+        await self.release.wait()
+        return self._results[:max_results]
+
+
+class StubCrawler:
+    def __init__(self, failing_urls: tuple[str, ...] = ()) -> None:
+        self._failing_urls = failing_urls
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def fetch(
+        self, url: str, *, max_text_chars: int | None = None, keep_html: bool = True
+    ) -> FetchedPage:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if url in self._failing_urls:
+                raise httpx.ConnectError("unreachable")
+            return FetchedPage(
+                url=url,
+                status_code=200,
+                content=b"",
+                content_type="text/html",
+                text=f"Body of {url}",
+            )
+        finally:
+            self.in_flight -= 1
+
+
 @pytest.mark.asyncio
 async def test_service_returns_summary() -> None:
     results = [
@@ -49,8 +92,8 @@ async def test_service_returns_summary() -> None:
 
     response = await service.query(agent_id="agent-1", query="test", max_results=2)
     assert isinstance(response, QueryResponse)
-    assert response.summary["overview"] == "Overview snippet."
-    assert response.summary["highlights"] == ["Highlight A."]
+    assert response.summary.overview == "Overview snippet."
+    assert response.summary.highlights == ("Highlight A.",)
     assert len(response.results) == 2
 @pytest.mark.asyncio
 async def test_service_uses_cache() -> None:
@@ -73,3 +116,190 @@ async def test_service_uses_cache() -> None:
 
     assert first.summary == second.summary
     assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_service_fetches_top_pages_concurrently() -> None:
+    results = [
+        SearchResult(title=f"Page {i}", url=f"https://example.com/{i}", snippet=f"Snippet {i}.")
+        for i in range(4)
+    ]
+    crawler = StubCrawler(failing_urls=("https://example.com/1",))
+    service = WebSearchService(
+        rate_limiter=StubRateLimiter(),
+        telemetry=Telemetry(),
+        search_client=StubSearchClient(results),
+        summarizer=Summarizer(),
+        crawler=crawler,  # type: ignore[arg-type]
+        max_pages_to_fetch=3,
+    )
+
+    response = await service.query(agent_id="agent-1", query="pages", max_results=4)
+
+    assert crawler.max_in_flight == 3
+    assert response.fetched_pages is not None
+    assert [page["url"] for page in response.fetched_pages] == [
+        "https://example.com/0",
+        "https://example.com/2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_service_reuses_cached_pages() -> None:
+    crawler = StubCrawler()
+    service = WebSearchService(
+        rate_limiter=StubRateLimiter(),
+        telemetry=Telemetry(),
+        search_client=StubSearchClient([]),
+        summarizer=Summarizer(),
+        crawler=crawler,  # type: ignore[arg-type]
+        page_cache=QueryCache(ttl_seconds=60),
+    )
+
+    first = await service.fetch_page("https://example.com/page")
+    second = await service.fetch_page("https://example.com/page")
+
+    assert first == second
+    assert crawler.calls == 1
+
+
+class BodyCrawler:
+    def __init__(self, content: bytes, content_type: str) -> None:
+        self._content = content
+        self._content_type = content_type
+
+    async def fetch(
+        self, url: str, *, max_text_chars: int | None = None, keep_html: bool = True
+    ) -> FetchedPage:
+        return FetchedPage(
+            url=url,
+            status_code=200,
+            content=self._content if keep_html else b"",
+            content_type=self._content_type,
+            text="Body",
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("content", "content_type", "cached_bytes"),
+    [
+        ("héllo wörld, long page".encode("utf-8"), "text/html; charset=utf-8", 20),
+        (b"%PDF-1.7 binary payload", "application/pdf", 0),
+    ],
+)
+async def test_page_cache_keeps_only_returned_body(
+    monkeypatch: pytest.MonkeyPatch, content: bytes, content_type: str, cached_bytes: int
+) -> None:
+    monkeypatch.setattr(service_module, "_PAGE_TEXT_CHARS", 5)
+    page_cache = QueryCache(ttl_seconds=60)
+    service = WebSearchService(
+        rate_limiter=StubRateLimiter(),
+        telemetry=Telemetry(),
+        search_client=StubSearchClient([]),
+        summarizer=Summarizer(),
+        crawler=BodyCrawler(content, content_type),  # type: ignore[arg-type]
+        page_cache=page_cache,
+    )
+
+    first = await service.fetch_page("https://example.com/page")
+    second = await service.fetch_page("https://example.com/page")
+
+    assert first == second
+    [entry] = page_cache._store.values()
+    assert len(entry.value.content) == cached_bytes
+
+
+@pytest.mark.asyncio
+async def test_service_coalesces_identical_inflight_queries() -> None:
+    client = GatedSearchClient(
+        [SearchResult(title="Shared", url="https://example.com/shared", snippet="Shared.")]
+    )
+    service = WebSearchService(
+        rate_limiter=StubRateLimiter(),
+        telemetry=Telemetry(),
+        search_client=client,  # type: ignore[arg-type]
+        summarizer=Summarizer(),
+        crawler=None,
+    )
+
+    pending = [
+        asyncio.create_task(service.query(agent_id=f"agent-{i}", query="same", max_results=1))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    client.release.set()
+    responses = await asyncio.gather(*pending)
+
+    assert client.calls == 1
+    assert all(response is responses[0] for response in responses)
+
+
+def test_query_response_encodes_each_shape_once() -> None:
+    response = QueryResponse(summary=Summary(overview="o", highlights=()), results=[])
+    renders = []
+
+    def render(item: QueryResponse) -> dict:
+        renders.append(item)
+        return {"overview": item.summary.overview}
+
+    first = response.encoded("overview", render)
+    second = response.encoded("overview", render)
+
+    assert first == second == b'{"overview":"o"}'
+    assert len(renders) == 1
+
+
+@pytest.mark.asyncio
+async def test_joined_queries_do_not_consume_rate_limit() -> None:
+    client = GatedSearchClient(
+        [SearchResult(title="Shared", url="https://example.com/shared", snippet="Shared.")]
+    )
+    service = WebSearchService(
+        rate_limiter=RateLimiter(
+            RateLimiterConfig(max_concurrent_per_agent=1, max_queries_per_minute=1)
+        ),
+        telemetry=Telemetry(),
+        search_client=client,  # type: ignore[arg-type]
+        summarizer=Summarizer(),
+        crawler=None,
+    )
+
+    pending = [
+        asyncio.create_task(service.query(agent_id="agent", query="same", max_results=1))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    client.release.set()
+    responses = await asyncio.gather(*pending)
+
+    assert client.calls == 1
+    assert len(responses) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelling_first_caller_does_not_cancel_joined_query() -> None:
+    client = GatedSearchClient(
+        [SearchResult(title="Shared", url="https://example.com/shared", snippet="Shared.")]
+    )
+    service = WebSearchService(
+        rate_limiter=StubRateLimiter(),
+        telemetry=Telemetry(),
+        search_client=client,  # type: ignore[arg-type]
+        summarizer=Summarizer(),
+        crawler=None,
+    )
+
+    leader = asyncio.create_task(service.query(agent_id="a", query="same", max_results=1))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(service.query(agent_id="b", query="same", max_results=1))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    client.release.set()
+    response = await joiner
+
+    assert leader.cancelled()
+    assert response.summary.overview == "Shared."
+    assert client.calls == 1
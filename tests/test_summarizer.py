@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from urllib.parse import urlparse
+
+import pytest
+
+from search_client import SearchResult
+from summarizer import Summarizer, _netloc
+
+
+def test_first_listed_domain_boost_wins() -> None:
+    summarizer = Summarizer()
+
+    # "accuweather.com" also contains "weather.com", which is listed first.
+    assert summarizer._score_snippet("abc", "abc", "https://www.accuweather.com/x") == 3 + 150.0
+    assert summarizer._score_snippet("abc", "abc", "https://www.bbc.com/x") == 3 + 120.0
+    assert summarizer._score_snippet("abc", "abc", "https://example.com/x") == 3.0
+
+
+def test_phrase_bonuses_apply_once_each() -> None:
+    summarizer = Summarizer()
+
+    snippet = "Forecast and current forecast"
+    score = summarizer._score_snippet(snippet, snippet.lower(), "https://example.com")
+    assert score == len(snippet) + 60.0
+
+
+def test_build_summary_ranks_and_deduplicates() -> None:
+    results = [
+        SearchResult(title="a", url="https://example.com/a", snippet="Plain snippet."),
+        SearchResult(title="b", url="https://bbc.com/b", snippet="Short."),
+        SearchResult(title="c", url="https://example.com/c", snippet="PLAIN SNIPPET."),
+        SearchResult(title="d", url="https://example.com/d", snippet="  "),
+    ]
+
+    summary = Summarizer().build_summary(results)
+
+    assert summary.overview == "Short."
+    assert summary.highlights == ("Plain snippet.",)
+
+
+def test_build_summary_without_snippets() -> None:
+    summarizer = Summarizer()
+    summary = summarizer.build_summary([])
+
+    assert summary.overview == "No concise results matched this query."
+    assert summary.highlights == ()
+    assert summarizer.build_summary([SearchResult(title="t", url="u", snippet=" ")]) is summary
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.BBC.com/news?ref=x",
+        "https://example.com?ref=bbc.com",
+        "https://example.com#bbc.com",
+        "//weather.com/london",
+        "https://user@host.example:8443/path",
+        "example.com/?next=https://bbc.com",
+        "mailto:someone@bbc.com",
+        "",
+    ],
+)
+def test_netloc_matches_urlparse(url: str) -> None:
+    assert _netloc(url) == urlparse(url).netloc.lower()
+
+
+def test_build_summary_respects_max_highlights() -> None:
+    results = [
+        SearchResult(title=str(i), url="https://example.com", snippet="x" * i)
+        for i in range(1, 7)
+    ]
+    summarizer = Summarizer()
+
+    limited = summarizer.build_summary(results, max_highlights=1)
+    overview_only = summarizer.build_summary(results, max_highlights=0)
+
+    assert limited.overview == "x" * 6
+    assert limited.highlights == ("x" * 5,)
+    assert overview_only.overview == "x" * 6
+    assert overview_only.highlights == ()
+
+
+def test_build_summary_without_snippets_from_iterator() -> None:
+    summary = Summarizer().build_summary(iter([]))
+
+    assert summary.overview == "No concise results matched this query."
+    assert summary.highlights == ()
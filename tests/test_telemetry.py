@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+from prometheus_client import REGISTRY
+
+import telemetry
+from telemetry import Telemetry
+from tests.conftest import FakeClock
+
+
+def _query_total(agent_id: str) -> float:
+    return REGISTRY.get_sample_value("web_search_queries_total", {"agent_id": agent_id}) or 0.0
+
+
+def test_query_counts_are_batched_until_threshold_or_flush(
+    monkeypatch: pytest.MonkeyPatch, fake_clock: FakeClock
+) -> None:
+    monkeypatch.setattr(telemetry, "_monotonic", fake_clock.monotonic)
+    monkeypatch.setattr(telemetry, "_FLUSH_THRESHOLD", 3)
+    metrics = Telemetry()
+
+    # A thread's first query is pushed at once; later ones wait for a full batch.
+    metrics.record_query("batch-agent", 0.1)
+    assert _query_total("batch-agent") == 1.0
+
+    metrics.record_query("batch-agent", 0.1)
+    metrics.record_query("batch-agent", 0.1)
+    assert _query_total("batch-agent") == 1.0
+
+    metrics.record_query("batch-agent", 0.1)
+    assert _query_total("batch-agent") == 4.0
+
+    metrics.record_query("batch-agent", 0.1)
+    metrics.flush()
+    assert _query_total("batch-agent") == 5.0
+
+
+def test_query_counts_are_pushed_after_flush_interval(
+    monkeypatch: pytest.MonkeyPatch, fake_clock: FakeClock
+) -> None:
+    monkeypatch.setattr(telemetry, "_monotonic", fake_clock.monotonic)
+    metrics = Telemetry()
+
+    metrics.record_query("idle-agent", 0.1)
+    metrics.record_query("idle-agent", 0.1)
+    assert _query_total("idle-agent") == 1.0
+
+    fake_clock.now = telemetry._FLUSH_INTERVAL_SECONDS
+    metrics.record_query("idle-agent", 0.1)
+    assert _query_total("idle-agent") == 3.0
@@ -1,22 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from service import QueryResponse, WebSearchService
 
 
-@dataclass
+@dataclass(slots=True)
 class WebSearchToolResult:
     """Structured payload suitable for MCP tool responses."""
 
     overview: str
-    highlights: List[str]
+    highlights: Tuple[str, ...]
     sources: List[Dict[str, Any]]
     fetched_pages: Optional[List[Dict[str, Any]]]
 
 
-@dataclass
+@dataclass(slots=True)
 class WebPageContentResult:
     url: str
     status_code: int
@@ -44,8 +44,8 @@ class WebSearchTool:
             max_results=max_results,
         )
         return WebSearchToolResult(
-            overview=response.summary["overview"],
-            highlights=response.summary.get("highlights", []),
+            overview=response.summary.overview,
+            highlights=response.summary.highlights,
             sources=response.results,
             fetched_pages=response.fetched_pages,
         )